@@ -17,11 +17,18 @@ Endpoints:
   GET  /health                  → Health check
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi import FastAPI, HTTPException, Depends, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Optional, List
-from datetime import datetime, date
+from dataclasses import dataclass
+from datetime import datetime, date, timezone
+from functools import lru_cache
+from enum import Enum
+from uuid import uuid4
+import hashlib
 import os
 from dotenv import load_dotenv
 
@@ -31,6 +38,7 @@ app = FastAPI(
     title="Phoenix Workout API",
     description="AI-powered workout generation for Vitruvian Trainer+ owners",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS — allow the Android/iOS app + local dev
@@ -42,22 +50,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Gzip JSON bodies over 1 KB (exercise library, workout plans) for mobile clients
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 
 # ── Auth (placeholder — swap for Supabase JWT validation) ──────────────────
 
-def get_user_id(x_user_id: Optional[str] = Header(None)) -> str:
+async def get_user_id(x_user_id: str = Header(..., alias="X-User-Id", min_length=1)) -> str:
     """
     MVP auth: client sends X-User-Id header.
+    Missing or empty header is rejected by FastAPI's validation with a 422.
     V2: validate Supabase JWT and extract user ID from claims.
     """
-    if not x_user_id:
-        raise HTTPException(status_code=401, detail="X-User-Id header required")
     return x_user_id
 
 
 # ── Models ─────────────────────────────────────────────────────────────────
 
-class ExerciseType:
+class ExerciseType(str, Enum):
     VITRUVIAN  = "VITRUVIAN"
     DUMBBELL   = "DUMBBELL"
     BARBELL    = "BARBELL"
@@ -80,7 +90,7 @@ class PlannedExercise(BaseModel):
     order_index: int
     exercise_id: str
     exercise_name: str
-    exercise_type: str = ExerciseType.VITRUVIAN
+    exercise_type: ExerciseType = ExerciseType.VITRUVIAN
     muscle_group: str
     sets: List[PlannedSet]
     rest_seconds: int = 60
@@ -117,10 +127,13 @@ class WorkoutCompletionLog(BaseModel):
     notes: Optional[str] = None
 
 
-class ExerciseDefinition(BaseModel):
+# Plain dataclass, not BaseModel: library entries are trusted seed data that
+# only ever get serialized out, never validated from a request.
+@dataclass(slots=True, frozen=True)
+class ExerciseDefinition:
     id: str
     name: str
-    exercise_type: str
+    exercise_type: ExerciseType
     muscle_group: str
     equipment: str
     description: Optional[str] = None
@@ -130,146 +143,179 @@ class ExerciseDefinition(BaseModel):
 
 # ── Exercise Library (seed data — will move to DB) ─────────────────────────
 
-HYBRID_EXERCISE_LIBRARY: List[ExerciseDefinition] = [
-    # ── Dumbbell ──────────────────────────────────────────────────────────
-    ExerciseDefinition(
-        id="db-chest-press", name="Dumbbell Chest Press",
-        exercise_type=ExerciseType.DUMBBELL, muscle_group="CHEST", equipment="DUMBBELL",
-        coaching_note="Neutral spine, scapulae retracted. Lower until elbows at 90°."
-    ),
-    ExerciseDefinition(
-        id="db-row", name="Dumbbell Row",
-        exercise_type=ExerciseType.DUMBBELL, muscle_group="BACK", equipment="DUMBBELL",
-        coaching_note="Brace core. Drive elbow to hip, not shoulder."
-    ),
-    ExerciseDefinition(
-        id="db-shoulder-press", name="Dumbbell Shoulder Press",
-        exercise_type=ExerciseType.DUMBBELL, muscle_group="SHOULDERS", equipment="DUMBBELL",
-        coaching_note="Do not hyperextend lumbar. Press vertical, not forward."
-    ),
-    ExerciseDefinition(
-        id="db-rdl", name="Romanian Deadlift (DB)",
-        exercise_type=ExerciseType.DUMBBELL, muscle_group="HAMSTRINGS", equipment="DUMBBELL",
-        coaching_note="Hip hinge, not squat. Maintain neutral spine throughout."
-    ),
-    ExerciseDefinition(
-        id="db-lateral-raise", name="Lateral Raise",
-        exercise_type=ExerciseType.DUMBBELL, muscle_group="SHOULDERS", equipment="DUMBBELL",
-        coaching_note="Lead with elbows, not wrists. Stop at shoulder height."
-    ),
-    ExerciseDefinition(
-        id="db-bicep-curl", name="Dumbbell Bicep Curl",
-        exercise_type=ExerciseType.DUMBBELL, muscle_group="BICEPS", equipment="DUMBBELL",
-        coaching_note="Supinate at the top. Control the eccentric."
-    ),
-    ExerciseDefinition(
-        id="db-tricep-kickback", name="Tricep Kickback",
-        exercise_type=ExerciseType.DUMBBELL, muscle_group="TRICEPS", equipment="DUMBBELL",
-        coaching_note="Upper arm parallel to floor. Full extension at top."
-    ),
-    ExerciseDefinition(
-        id="db-goblet-squat", name="Goblet Squat",
-        exercise_type=ExerciseType.DUMBBELL, muscle_group="QUADS", equipment="DUMBBELL",
-        coaching_note="Elbows inside knees at bottom. Drive through heels."
-    ),
-
-    # ── Bodyweight ─────────────────────────────────────────────────────────
-    ExerciseDefinition(
-        id="bw-pushup", name="Push-Up",
-        exercise_type=ExerciseType.BODYWEIGHT, muscle_group="CHEST", equipment="BODYWEIGHT",
-        coaching_note="Rigid plank from head to heel. Elbows 45° from torso."
-    ),
-    ExerciseDefinition(
-        id="bw-pullup", name="Pull-Up",
-        exercise_type=ExerciseType.BODYWEIGHT, muscle_group="BACK", equipment="BODYWEIGHT",
-        coaching_note="Dead hang start. Drive elbows down to lats, not shoulders."
-    ),
-    ExerciseDefinition(
-        id="bw-dip", name="Dip",
-        exercise_type=ExerciseType.BODYWEIGHT, muscle_group="TRICEPS", equipment="BODYWEIGHT",
-        coaching_note="Slight forward lean for chest emphasis. Don't flare elbows."
-    ),
-    ExerciseDefinition(
-        id="bw-plank", name="Plank",
-        exercise_type=ExerciseType.BODYWEIGHT, muscle_group="CORE", equipment="BODYWEIGHT",
-        coaching_note="Neutral spine. Squeeze glutes and abs. Don't hold breath."
-    ),
-    ExerciseDefinition(
-        id="bw-squat", name="Bodyweight Squat",
-        exercise_type=ExerciseType.BODYWEIGHT, muscle_group="QUADS", equipment="BODYWEIGHT",
-        coaching_note="Feet shoulder-width. Knees track toes. Full depth if mobility allows."
-    ),
-    ExerciseDefinition(
-        id="bw-lunge", name="Reverse Lunge",
-        exercise_type=ExerciseType.BODYWEIGHT, muscle_group="QUADS", equipment="BODYWEIGHT",
-        coaching_note="Step back, not forward. Rear knee hovers 1\" above floor."
-    ),
-    ExerciseDefinition(
-        id="bw-glute-bridge", name="Glute Bridge",
-        exercise_type=ExerciseType.BODYWEIGHT, muscle_group="GLUTES", equipment="BODYWEIGHT",
-        coaching_note="Drive through heels. Full hip extension at top. Pause 1 second."
-    ),
-
-    # ── TRX ────────────────────────────────────────────────────────────────
-    ExerciseDefinition(
-        id="trx-row", name="TRX Row",
-        exercise_type=ExerciseType.TRX, muscle_group="BACK", equipment="TRX",
-        coaching_note="Body angle controls difficulty. Retract scapulae before pulling."
-    ),
-    ExerciseDefinition(
-        id="trx-chest-press", name="TRX Chest Press",
-        exercise_type=ExerciseType.TRX, muscle_group="CHEST", equipment="TRX",
-        coaching_note="Lean forward for more load. Keep rigid plank throughout."
-    ),
-    ExerciseDefinition(
-        id="trx-bicep-curl", name="TRX Bicep Curl",
-        exercise_type=ExerciseType.TRX, muscle_group="BICEPS", equipment="TRX",
-        coaching_note="Elbows fixed, walk feet forward for more load."
-    ),
-    ExerciseDefinition(
-        id="trx-squat", name="TRX Squat",
-        exercise_type=ExerciseType.TRX, muscle_group="QUADS", equipment="TRX",
-        coaching_note="Hold handles for counterbalance. Allows deeper squat."
-    ),
-    ExerciseDefinition(
-        id="trx-plank", name="TRX Plank",
-        exercise_type=ExerciseType.TRX, muscle_group="CORE", equipment="TRX",
-        coaching_note="Feet in straps. Harder than floor plank — high core demand."
-    ),
-
-    # ── Rest Timer (template) ───────────────────────────────────────────────
-    ExerciseDefinition(
-        id="rest-60", name="Rest (60 sec)",
-        exercise_type=ExerciseType.REST_TIMER, muscle_group="RECOVERY", equipment="NONE",
-        coaching_note="Active recovery. Breathe. Shake out the pump."
-    ),
-    ExerciseDefinition(
-        id="rest-90", name="Rest (90 sec)",
-        exercise_type=ExerciseType.REST_TIMER, muscle_group="RECOVERY", equipment="NONE",
-        coaching_note="Longer recovery for heavy compound sets."
-    ),
-    ExerciseDefinition(
-        id="rest-120", name="Rest (2 min)",
-        exercise_type=ExerciseType.REST_TIMER, muscle_group="RECOVERY", equipment="NONE",
-        coaching_note="Full recovery. Used after max-effort sets."
-    ),
-]
+@lru_cache(maxsize=1)
+def _library() -> List[ExerciseDefinition]:
+    """Seed exercise library. Built on first use so cold starts don't pay for it."""
+    return [
+        # ── Dumbbell ──────────────────────────────────────────────────────────
+        ExerciseDefinition(
+            id="db-chest-press", name="Dumbbell Chest Press",
+            exercise_type=ExerciseType.DUMBBELL, muscle_group="CHEST", equipment="DUMBBELL",
+            coaching_note="Neutral spine, scapulae retracted. Lower until elbows at 90°."
+        ),
+        ExerciseDefinition(
+            id="db-row", name="Dumbbell Row",
+            exercise_type=ExerciseType.DUMBBELL, muscle_group="BACK", equipment="DUMBBELL",
+            coaching_note="Brace core. Drive elbow to hip, not shoulder."
+        ),
+        ExerciseDefinition(
+            id="db-shoulder-press", name="Dumbbell Shoulder Press",
+            exercise_type=ExerciseType.DUMBBELL, muscle_group="SHOULDERS", equipment="DUMBBELL",
+            coaching_note="Do not hyperextend lumbar. Press vertical, not forward."
+        ),
+        ExerciseDefinition(
+            id="db-rdl", name="Romanian Deadlift (DB)",
+            exercise_type=ExerciseType.DUMBBELL, muscle_group="HAMSTRINGS", equipment="DUMBBELL",
+            coaching_note="Hip hinge, not squat. Maintain neutral spine throughout."
+        ),
+        ExerciseDefinition(
+            id="db-lateral-raise", name="Lateral Raise",
+            exercise_type=ExerciseType.DUMBBELL, muscle_group="SHOULDERS", equipment="DUMBBELL",
+            coaching_note="Lead with elbows, not wrists. Stop at shoulder height."
+        ),
+        ExerciseDefinition(
+            id="db-bicep-curl", name="Dumbbell Bicep Curl",
+            exercise_type=ExerciseType.DUMBBELL, muscle_group="BICEPS", equipment="DUMBBELL",
+            coaching_note="Supinate at the top. Control the eccentric."
+        ),
+        ExerciseDefinition(
+            id="db-tricep-kickback", name="Tricep Kickback",
+            exercise_type=ExerciseType.DUMBBELL, muscle_group="TRICEPS", equipment="DUMBBELL",
+            coaching_note="Upper arm parallel to floor. Full extension at top."
+        ),
+        ExerciseDefinition(
+            id="db-goblet-squat", name="Goblet Squat",
+            exercise_type=ExerciseType.DUMBBELL, muscle_group="QUADS", equipment="DUMBBELL",
+            coaching_note="Elbows inside knees at bottom. Drive through heels."
+        ),
 
+        # ── Bodyweight ─────────────────────────────────────────────────────────
+        ExerciseDefinition(
+            id="bw-pushup", name="Push-Up",
+            exercise_type=ExerciseType.BODYWEIGHT, muscle_group="CHEST", equipment="BODYWEIGHT",
+            coaching_note="Rigid plank from head to heel. Elbows 45° from torso."
+        ),
+        ExerciseDefinition(
+            id="bw-pullup", name="Pull-Up",
+            exercise_type=ExerciseType.BODYWEIGHT, muscle_group="BACK", equipment="BODYWEIGHT",
+            coaching_note="Dead hang start. Drive elbows down to lats, not shoulders."
+        ),
+        ExerciseDefinition(
+            id="bw-dip", name="Dip",
+            exercise_type=ExerciseType.BODYWEIGHT, muscle_group="TRICEPS", equipment="BODYWEIGHT",
+            coaching_note="Slight forward lean for chest emphasis. Don't flare elbows."
+        ),
+        ExerciseDefinition(
+            id="bw-plank", name="Plank",
+            exercise_type=ExerciseType.BODYWEIGHT, muscle_group="CORE", equipment="BODYWEIGHT",
+            coaching_note="Neutral spine. Squeeze glutes and abs. Don't hold breath."
+        ),
+        ExerciseDefinition(
+            id="bw-squat", name="Bodyweight Squat",
+            exercise_type=ExerciseType.BODYWEIGHT, muscle_group="QUADS", equipment="BODYWEIGHT",
+            coaching_note="Feet shoulder-width. Knees track toes. Full depth if mobility allows."
+        ),
+        ExerciseDefinition(
+            id="bw-lunge", name="Reverse Lunge",
+            exercise_type=ExerciseType.BODYWEIGHT, muscle_group="QUADS", equipment="BODYWEIGHT",
+            coaching_note="Step back, not forward. Rear knee hovers 1\" above floor."
+        ),
+        ExerciseDefinition(
+            id="bw-glute-bridge", name="Glute Bridge",
+            exercise_type=ExerciseType.BODYWEIGHT, muscle_group="GLUTES", equipment="BODYWEIGHT",
+            coaching_note="Drive through heels. Full hip extension at top. Pause 1 second."
+        ),
 
-# ── AI Workout Generation (MVP: rule-based progressive overload) ───────────
+        # ── TRX ────────────────────────────────────────────────────────────────
+        ExerciseDefinition(
+            id="trx-row", name="TRX Row",
+            exercise_type=ExerciseType.TRX, muscle_group="BACK", equipment="TRX",
+            coaching_note="Body angle controls difficulty. Retract scapulae before pulling."
+        ),
+        ExerciseDefinition(
+            id="trx-chest-press", name="TRX Chest Press",
+            exercise_type=ExerciseType.TRX, muscle_group="CHEST", equipment="TRX",
+            coaching_note="Lean forward for more load. Keep rigid plank throughout."
+        ),
+        ExerciseDefinition(
+            id="trx-bicep-curl", name="TRX Bicep Curl",
+            exercise_type=ExerciseType.TRX, muscle_group="BICEPS", equipment="TRX",
+            coaching_note="Elbows fixed, walk feet forward for more load."
+        ),
+        ExerciseDefinition(
+            id="trx-squat", name="TRX Squat",
+            exercise_type=ExerciseType.TRX, muscle_group="QUADS", equipment="TRX",
+            coaching_note="Hold handles for counterbalance. Allows deeper squat."
+        ),
+        ExerciseDefinition(
+            id="trx-plank", name="TRX Plank",
+            exercise_type=ExerciseType.TRX, muscle_group="CORE", equipment="TRX",
+            coaching_note="Feet in straps. Harder than floor plank — high core demand."
+        ),
 
-def generate_workout_plan(user_id: str, user_history: list = None) -> WorkoutPlan:
-    """
-    MVP: Returns a template upper push day.
-    V2: Query user's progression history + AI model to auto-progress weights/reps.
-    V3: Adapt to available equipment (home vs gym vs travel hotel).
-    """
-    from uuid import uuid4
+        # ── Rest Timer (template) ───────────────────────────────────────────────
+        ExerciseDefinition(
+            id="rest-60", name="Rest (60 sec)",
+            exercise_type=ExerciseType.REST_TIMER, muscle_group="RECOVERY", equipment="NONE",
+            coaching_note="Active recovery. Breathe. Shake out the pump."
+        ),
+        ExerciseDefinition(
+            id="rest-90", name="Rest (90 sec)",
+            exercise_type=ExerciseType.REST_TIMER, muscle_group="RECOVERY", equipment="NONE",
+            coaching_note="Longer recovery for heavy compound sets."
+        ),
+        ExerciseDefinition(
+            id="rest-120", name="Rest (2 min)",
+            exercise_type=ExerciseType.REST_TIMER, muscle_group="RECOVERY", equipment="NONE",
+            coaching_note="Full recovery. Used after max-effort sets."
+        ),
+    ]
+
+
+# One shared TypeAdapter so the list schema is only built once.
+_EX_LIST_ADAPTER = TypeAdapter(List[ExerciseDefinition])
+
+
+# The library is static, so each exercise route serializes its payload once
+# (lazily, on first request) and afterwards returns the cached bytes as-is.
+
+@lru_cache(maxsize=1)
+def _exercises_json() -> bytes:
+    return _EX_LIST_ADAPTER.dump_json(_library())
+
+
+@lru_cache(maxsize=1)
+def _exercises_etag() -> str:
+    return '"' + hashlib.blake2b(_exercises_json(), digest_size=8).hexdigest() + '"'
 
-    plan_id = f"plan_{uuid4().hex[:8]}"
 
+# Types that never appear in /exercises/hybrid
+_EXCLUDED = frozenset({ExerciseType.VITRUVIAN})
+# Accepted ?exercise_type= values for /exercises/hybrid
+_VALID_HYBRID_TYPES = frozenset(t.value for t in ExerciseType if t not in _EXCLUDED)
+
+
+@lru_cache(maxsize=1)
+def _hybrid_json_by_type() -> dict[Optional[str], bytes]:
+    """Non-Vitruvian exercises grouped by type; the None key holds all of them."""
+    by_type: dict[Optional[str], List[ExerciseDefinition]] = {t: [] for t in _VALID_HYBRID_TYPES}
+    by_type[None] = []
+    for e in _library():
+        if e.exercise_type not in _EXCLUDED:
+            by_type.setdefault(e.exercise_type, []).append(e)
+            by_type[None].append(e)
+    return {t: _EX_LIST_ADAPTER.dump_json(exercises) for t, exercises in by_type.items()}
+
+
+# ── AI Workout Generation (MVP: rule-based progressive overload) ───────────
+
+def _build_upper_push_exercises() -> List[PlannedExercise]:
+    """Template upper push day — built once at import, see _TEMPLATE_EXERCISES."""
+    # Everything below is hard-coded template data, so build the models with
+    # model_construct() and skip validation. model_construct() also does no
+    # coercion, so pass every field (floats as floats) explicitly.
     exercises = [
-        PlannedExercise(
+        PlannedExercise.model_construct(
             order_index=0,
             exercise_id="cable-chest-press",   # Vitruvian exercise
             exercise_name="Cable Chest Press",
@@ -277,23 +323,28 @@ def generate_workout_plan(user_id: str, user_history: list = None) -> WorkoutPla
             muscle_group="CHEST",
             cable_config="DOUBLE",
             coaching_note="Set cable at chest height. Drive elbows together at lockout.",
+            rest_seconds=60,
+            is_travel_substitute=False,
             sets=[
-                PlannedSet(set_number=1, set_type="WARMUP", target_reps=15, target_weight_kg=10),
-                PlannedSet(set_number=2, set_type="STANDARD", target_reps=10, target_weight_kg=20),
-                PlannedSet(set_number=3, set_type="STANDARD", target_reps=10, target_weight_kg=20),
-                PlannedSet(set_number=4, set_type="STANDARD", target_reps=8, target_weight_kg=22.5),
+                PlannedSet.model_construct(set_number=1, set_type="WARMUP", target_reps=15, target_weight_kg=10.0, target_rpe=None, rest_seconds=60),
+                PlannedSet.model_construct(set_number=2, set_type="STANDARD", target_reps=10, target_weight_kg=20.0, target_rpe=None, rest_seconds=60),
+                PlannedSet.model_construct(set_number=3, set_type="STANDARD", target_reps=10, target_weight_kg=20.0, target_rpe=None, rest_seconds=60),
+                PlannedSet.model_construct(set_number=4, set_type="STANDARD", target_reps=8, target_weight_kg=22.5, target_rpe=None, rest_seconds=60),
             ]
         ),
-        PlannedExercise(
+        PlannedExercise.model_construct(
             order_index=1,
             exercise_id="rest-90",
             exercise_name="Rest",
             exercise_type=ExerciseType.REST_TIMER,
             muscle_group="RECOVERY",
-            sets=[PlannedSet(set_number=1, set_type="REST", rest_seconds=90)],
+            cable_config="DOUBLE",
+            coaching_note=None,
+            is_travel_substitute=False,
+            sets=[PlannedSet.model_construct(set_number=1, set_type="REST", target_reps=None, target_weight_kg=None, target_rpe=None, rest_seconds=90)],
             rest_seconds=90
         ),
-        PlannedExercise(
+        PlannedExercise.model_construct(
             order_index=2,
             exercise_id="cable-shoulder-press",
             exercise_name="Cable Shoulder Press",
@@ -301,65 +352,93 @@ def generate_workout_plan(user_id: str, user_history: list = None) -> WorkoutPla
             muscle_group="SHOULDERS",
             cable_config="DOUBLE",
             coaching_note="Press vertical. Brace core to protect lumbar.",
+            rest_seconds=60,
+            is_travel_substitute=False,
             sets=[
-                PlannedSet(set_number=1, set_type="STANDARD", target_reps=10, target_weight_kg=15),
-                PlannedSet(set_number=2, set_type="STANDARD", target_reps=10, target_weight_kg=15),
-                PlannedSet(set_number=3, set_type="STANDARD", target_reps=8, target_weight_kg=17.5),
+                PlannedSet.model_construct(set_number=1, set_type="STANDARD", target_reps=10, target_weight_kg=15.0, target_rpe=None, rest_seconds=60),
+                PlannedSet.model_construct(set_number=2, set_type="STANDARD", target_reps=10, target_weight_kg=15.0, target_rpe=None, rest_seconds=60),
+                PlannedSet.model_construct(set_number=3, set_type="STANDARD", target_reps=8, target_weight_kg=17.5, target_rpe=None, rest_seconds=60),
             ]
         ),
-        PlannedExercise(
+        PlannedExercise.model_construct(
             order_index=3,
             exercise_id="rest-60",
             exercise_name="Rest",
             exercise_type=ExerciseType.REST_TIMER,
             muscle_group="RECOVERY",
-            sets=[PlannedSet(set_number=1, set_type="REST", rest_seconds=60)],
+            cable_config="DOUBLE",
+            coaching_note=None,
+            is_travel_substitute=False,
+            sets=[PlannedSet.model_construct(set_number=1, set_type="REST", target_reps=None, target_weight_kg=None, target_rpe=None, rest_seconds=60)],
             rest_seconds=60
         ),
-        PlannedExercise(
+        PlannedExercise.model_construct(
             order_index=4,
             exercise_id="bw-pushup",
             exercise_name="Push-Up",
             exercise_type=ExerciseType.BODYWEIGHT,
             muscle_group="CHEST",
+            cable_config="DOUBLE",
             coaching_note="Finisher — go to near failure. Control the negative.",
+            rest_seconds=60,
+            is_travel_substitute=False,
             sets=[
-                PlannedSet(set_number=1, set_type="AMRAP", target_reps=None),
-                PlannedSet(set_number=2, set_type="AMRAP", target_reps=None),
+                PlannedSet.model_construct(set_number=1, set_type="AMRAP", target_reps=None, target_weight_kg=None, target_rpe=None, rest_seconds=60),
+                PlannedSet.model_construct(set_number=2, set_type="AMRAP", target_reps=None, target_weight_kg=None, target_rpe=None, rest_seconds=60),
             ]
         ),
     ]
+    return exercises
+
 
-    return WorkoutPlan(
-        plan_id=plan_id,
+# Only plan_id / user_id / generated_at vary per request. The exercise tree is
+# never mutated after this point, so every plan can share the same list.
+_TEMPLATE_EXERCISES: List[PlannedExercise] = _build_upper_push_exercises()
+
+
+def generate_workout_plan(user_id: str, user_history: list = None) -> WorkoutPlan:
+    """
+    MVP: Returns a template upper push day.
+    V2: Query user's progression history + AI model to auto-progress weights/reps.
+    V3: Adapt to available equipment (home vs gym vs travel hotel).
+    """
+    # Timezone-aware UTC, whole seconds
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    return WorkoutPlan.model_construct(
+        plan_id=f"plan_{uuid4().hex[:8]}",
         user_id=user_id,
-        generated_at=datetime.utcnow(),
+        generated_at=now,
         workout_name="Upper Push — Day 1",
         estimated_duration_minutes=35,
-        exercises=exercises,
+        exercises=_TEMPLATE_EXERCISES,
         ai_notes="Progressive overload target: +2.5kg on Cable Chest Press if all 4 sets completed at RPE <8."
     )
 
 
 # ── Routes ─────────────────────────────────────────────────────────────────
+# Handlers (and get_user_id) do no blocking I/O, so they are `async def` and run
+# on the event loop instead of FastAPI's threadpool. Blocking DB calls added
+# later must use an async client or go back to plain `def`.
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok", "service": "phoenix-workout-api", "version": "0.1.0"}
 
 
-@app.get("/workout/today", response_model=WorkoutPlan)
-def get_todays_workout(user_id: str = Depends(get_user_id)):
+# No response_model: the plan is built from trusted data, so skip FastAPI's
+# second validation pass and dump it straight to JSON. `responses` keeps the docs.
+@app.get("/workout/today", responses={200: {"model": WorkoutPlan}})
+async def get_todays_workout(user_id: str = Depends(get_user_id)):
     """
     Returns AI-generated workout plan for today.
     MVP: template-based. V2: progressive overload from history. V3: full AI.
     """
     plan = generate_workout_plan(user_id=user_id)
-    return plan
+    return Response(plan.model_dump_json(), media_type="application/json")
 
 
 @app.post("/workout/complete")
-def log_workout_completion(
+async def log_workout_completion(
     log: WorkoutCompletionLog,
     user_id: str = Depends(get_user_id)
 ):
@@ -368,9 +447,10 @@ def log_workout_completion(
     Stores for progressive overload calculation and PRs.
     MVP: just acknowledges. V2: write to DB + update progression.
     """
-    duration_minutes = (log.completed_at - log.started_at).seconds // 60
+    # total_seconds(), not .seconds — the latter drops the days component
+    duration_minutes = int((log.completed_at - log.started_at).total_seconds()) // 60
     total_sets = len(log.sets)
-    prs = [s for s in log.sets if s.is_pr]
+    new_prs = sum(1 for s in log.sets if s.is_pr)
 
     return {
         "status": "logged",
@@ -378,35 +458,45 @@ def log_workout_completion(
         "plan_id": log.plan_id,
         "sets_logged": total_sets,
         "duration_minutes": duration_minutes,
-        "new_prs": len(prs),
-        "message": f"Great work. {total_sets} sets logged. {'🔥 ' + str(len(prs)) + ' new PRs!' if prs else 'Keep pushing.'}"
+        "new_prs": new_prs,
+        "message": f"Great work. {total_sets} sets logged. {'🔥 ' + str(new_prs) + ' new PRs!' if new_prs else 'Keep pushing.'}"
     }
 
 
-@app.get("/exercises", response_model=List[ExerciseDefinition])
-def get_exercise_library():
+# Exercise routes return pre-serialized JSON; `responses` keeps the schema in the docs.
+
+@app.get("/exercises", responses={200: {"model": List[ExerciseDefinition]}})
+async def get_exercise_library(request: Request):
     """
     Returns the full hybrid exercise library (Vitruvian + all alternatives).
+    Sends an ETag; a matching If-None-Match gets an empty 304.
     MVP: in-memory seed data. V2: pull from Supabase DB.
     """
-    return HYBRID_EXERCISE_LIBRARY
+    etag = _exercises_etag()
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600, immutable"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(_exercises_json(), media_type="application/json", headers=headers)
 
 
-@app.get("/exercises/hybrid", response_model=List[ExerciseDefinition])
-def get_hybrid_exercises(exercise_type: Optional[str] = None):
+@app.get("/exercises/hybrid", responses={200: {"model": List[ExerciseDefinition]}})
+async def get_hybrid_exercises(exercise_type: Optional[str] = None):
     """
     Returns non-Vitruvian exercises only.
-    Optional filter: ?exercise_type=DUMBBELL | BODYWEIGHT | TRX | BARBELL
+    Optional filter: ?exercise_type=DUMBBELL | BODYWEIGHT | TRX | BARBELL | MACHINE | REST_TIMER
+    (case-insensitive; anything else is a 422).
     Used by travel mode exercise picker.
     """
-    exercises = [e for e in HYBRID_EXERCISE_LIBRARY if e.exercise_type != ExerciseType.VITRUVIAN]
+    key = None
     if exercise_type:
-        exercises = [e for e in exercises if e.exercise_type == exercise_type.upper()]
-    return exercises
+        key = exercise_type.upper()
+        if key not in _VALID_HYBRID_TYPES:
+            raise HTTPException(status_code=422, detail=f"Unknown exercise_type: {exercise_type}")
+    return Response(_hybrid_json_by_type()[key], media_type="application/json")
 
 
 @app.get("/user/{user_id}/history")
-def get_user_history(user_id: str, limit: int = 10):
+async def get_user_history(user_id: str, limit: int = 10):
     """
     Returns recent workout history for a user.
     MVP: stub. V2: query Supabase with user's workout logs.
@@ -424,5 +514,12 @@ if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8505))
     host = os.getenv("HOST", "0.0.0.0")
-    print(f"Phoenix Workout API starting on {host}:{port}")
-    uvicorn.run("main:app", host=host, port=port, reload=True)
+    # Dev: PHOENIX_RELOAD=1 for auto-reload (single process). Prod: one worker per core.
+    reload = os.getenv("PHOENIX_RELOAD", "0") == "1"
+    workers = 1 if reload else int(os.getenv("WORKERS", os.cpu_count() or 2))
+    print(f"Phoenix Workout API starting on {host}:{port} ({workers} worker(s), reload={reload})")
+    uvicorn.run(
+        "main:app", host=host, port=port,
+        reload=reload, workers=workers,
+        loop="uvloop", http="httptools",
+    )